@@ -1,12 +1,13 @@
 """Assorted utilities used in tests."""
+import functools
 import pathlib
 import sys
-from collections import defaultdict
-from typing import DefaultDict, Optional
+from copy import deepcopy
+from typing import Optional
 
 import numpy as np
 import pytest
-from openff.toolkit import ForceField, Molecule, Topology
+from openff.toolkit import Molecule, Topology
 from openff.toolkit.utils import (
     AmberToolsToolkitWrapper,
     OpenEyeToolkitWrapper,
@@ -76,14 +77,50 @@ def get_test_files_dir_path(dirname: Optional[str] = None) -> pathlib.Path:
         )
 
 
+@functools.lru_cache(None)
+def _build_molecule_with_conformer(
+    cls: type,
+    constructor: str,
+    smiles: str,
+    kwargs: frozenset,
+) -> Molecule:
+    molecule = getattr(Molecule, constructor).__func__(cls, smiles, **dict(kwargs))
+    molecule.generate_conformers(n_conformers=1)
+
+    return molecule
+
+
+def _get_molecule_with_conformer(
+    cls: type,
+    constructor: str,
+    smiles: str,
+    kwargs: dict,
+) -> Molecule:
+    """
+    Return a copy of a molecule with one conformer, generated once per set of arguments.
+
+    Conformer generation is slow and many tests use the same few molecules, so the first
+    result is cached and copies are handed out. Unhashable arguments are not cached.
+    """
+    try:
+        key = frozenset(kwargs.items())
+        hash(key)
+    except TypeError:
+        molecule = getattr(Molecule, constructor).__func__(cls, smiles, **kwargs)
+        molecule.generate_conformers(n_conformers=1)
+
+        return molecule
+
+    return deepcopy(_build_molecule_with_conformer(cls, constructor, smiles, key))
+
+
 class MoleculeWithConformer(Molecule):
     """Thin wrapper around `Molecule` to produce an instance with a conformer in one call."""
 
     @classmethod
     def from_smiles(self, smiles, name="", **kwargs):
         """Create from smiles and generate a single conformer."""
-        molecule = super().from_smiles(smiles, **kwargs)
-        molecule.generate_conformers(n_conformers=1)
+        molecule = _get_molecule_with_conformer(self, "from_smiles", smiles, kwargs)
         molecule.name = name
 
         return molecule
@@ -91,18 +128,62 @@ class MoleculeWithConformer(Molecule):
     @classmethod
     def from_mapped_smiles(self, smiles, name="", **kwargs):
         """Create from smiles and generate a single conformer."""
-        molecule = super().from_mapped_smiles(smiles, **kwargs)
-        molecule.generate_conformers(n_conformers=1)
+        molecule = _get_molecule_with_conformer(
+            self,
+            "from_mapped_smiles",
+            smiles,
+            kwargs,
+        )
         molecule.name = name
 
         return molecule
 
 
-class _BaseTest:
-    @pytest.fixture(autouse=True)
-    def _initdir(self, tmpdir):
-        tmpdir.chdir()
+def _cached_conformer(smiles: str) -> unit.Quantity:
+    """Return a copy of one conformer of a molecule made from `smiles`, generated once per session."""
+    molecule = _build_molecule_with_conformer(
+        MoleculeWithConformer,
+        "from_smiles",
+        smiles,
+        frozenset(),
+    )
+
+    return molecule.conformers[0].copy()
+
+
+@functools.lru_cache(None)
+def _build_mainchain_ala() -> Molecule:
+    molecule = Molecule.from_file(
+        get_data_file_path("proteins/MainChain_ALA.sdf", "openff.toolkit"),
+    )
+    molecule._add_default_hierarchy_schemes()
+    molecule.perceive_residues()
+    molecule.perceive_hierarchy()
+
+    return molecule
+
+
+@functools.lru_cache(None)
+def _build_mainchain_arg() -> Molecule:
+    molecule = Molecule.from_file(
+        get_data_file_path("proteins/MainChain_ARG.sdf", "openff.toolkit"),
+    )
+    molecule._add_default_hierarchy_schemes()
+    molecule.perceive_residues()
+    molecule.perceive_hierarchy()
+
+    return molecule
+
 
+@functools.lru_cache(None)
+def _build_hexane_diol() -> Molecule:
+    molecule = Molecule.from_smiles("OCCCCCCO")
+    molecule.assign_partial_charges(partial_charge_method="gasteiger")
+    molecule.partial_charges.m
+    return molecule
+
+
+class _BaseTest:
     @pytest.fixture()
     def basic_top(self):
         top = Molecule.from_smiles("C").to_topology()
@@ -114,31 +195,19 @@ class _BaseTest:
         """Fixture that builds a simple four ethanol topology."""
         return Topology.from_molecules(4 * [ethanol])
 
+    # The fixtures below return factories so that parsing only happens when (and if) a
+    # test calls them; each call returns a fresh copy of a molecule built once per session.
     @pytest.fixture()
     def mainchain_ala(self):
-        molecule = Molecule.from_file(
-            get_data_file_path("proteins/MainChain_ALA.sdf", "openff.toolkit"),
-        )
-        molecule._add_default_hierarchy_schemes()
-        molecule.perceive_residues()
-        molecule.perceive_hierarchy()
-
-        return molecule
+        return lambda: deepcopy(_build_mainchain_ala())
 
     @pytest.fixture()
     def mainchain_arg(self):
-        molecule = Molecule.from_file(
-            get_data_file_path("proteins/MainChain_ARG.sdf", "openff.toolkit"),
-        )
-        molecule._add_default_hierarchy_schemes()
-        molecule.perceive_residues()
-        molecule.perceive_hierarchy()
-
-        return molecule
+        return lambda: deepcopy(_build_mainchain_arg())
 
     @pytest.fixture()
     def two_peptides(self, mainchain_ala, mainchain_arg):
-        return Topology.from_molecules([mainchain_ala, mainchain_arg])
+        return lambda: Topology.from_molecules([mainchain_ala(), mainchain_arg()])
 
     xml_ff_bo_bonds = """<?xml version='1.0' encoding='ASCII'?>
     <SMIRNOFF version="0.3" aromaticity_model="OEAroModel_MDL">
@@ -156,10 +225,6 @@ class _BaseTest:
     def methane(self):
         return Molecule.from_smiles("C")
 
-    @pytest.fixture()
-    def parsley(self):
-        return ForceField("openff-1.0.0.offxml")
-
     @pytest.fixture()
     def hydrogen_cyanide(self):
         return Molecule.from_mapped_smiles("[H:1][C:2]#[N:3]")
@@ -170,10 +235,7 @@ class _BaseTest:
 
     @pytest.fixture()
     def hexane_diol(self):
-        molecule = Molecule.from_smiles("OCCCCCCO")
-        molecule.assign_partial_charges(partial_charge_method="gasteiger")
-        molecule.partial_charges.m
-        return molecule
+        return lambda: deepcopy(_build_hexane_diol())
 
     @pytest.fixture()
     def hydrogen_chloride(self):
@@ -190,154 +252,296 @@ class _BaseTest:
         )
 
 
-HAS_GROMACS = _find_gromacs_executable() is not None
-HAS_LAMMPS = _find_lammps_executable() is not None
-HAS_SANDER = has_executable("sander")
+@functools.lru_cache(None)
+def has_gromacs() -> bool:
+    """Return whether a GROMACS executable is available, searching `PATH` only once."""
+    return _find_gromacs_executable() is not None
 
-needs_gmx = pytest.mark.skipif(not HAS_GROMACS, reason="Needs GROMACS")
+
+@functools.lru_cache(None)
+def has_lammps() -> bool:
+    """Return whether a LAMMPS executable is available, searching `PATH` only once."""
+    return _find_lammps_executable() is not None
+
+
+@functools.lru_cache(None)
+def has_sander() -> bool:
+    """Return whether `sander` is available, searching `PATH` only once."""
+    return has_executable("sander")
+
+
+class _LazyCondition:
+    """A `skipif` condition which is only evaluated when pytest checks its truth value."""
+
+    def __init__(self, condition):
+        self._condition = condition
+
+    def __bool__(self) -> bool:
+        return bool(self._condition())
+
+
+needs_gmx = pytest.mark.skipif(
+    _LazyCondition(lambda: not has_gromacs()),
+    reason="Needs GROMACS",
+)
 needs_not_gmx = pytest.mark.skipif(
-    HAS_GROMACS,
+    _LazyCondition(has_gromacs),
     reason="Needs GROMACS to NOT be installed",
 )
-needs_lmp = pytest.mark.skipif(not HAS_LAMMPS, reason="Needs LAMMPS")
+needs_lmp = pytest.mark.skipif(
+    _LazyCondition(lambda: not has_lammps()),
+    reason="Needs LAMMPS",
+)
 needs_not_lmp = pytest.mark.skipif(
-    HAS_LAMMPS,
+    _LazyCondition(has_lammps),
     reason="Needs LAMMPS to NOT be installed",
 )
-needs_sander = pytest.mark.skipif(not HAS_SANDER, reason="Needs sander")
+needs_sander = pytest.mark.skipif(
+    _LazyCondition(lambda: not has_sander()),
+    reason="Needs sander",
+)
 needs_not_sander = pytest.mark.skipif(
-    HAS_SANDER,
+    _LazyCondition(has_sander),
     reason="sander needs to NOT be installed",
 )
 
 
 def _get_charges_from_openff_interchange(interchange):
-    charges_ = [*interchange["Electrostatics"].charges.values()]
-    charges = np.asarray([charge.magnitude for charge in charges_])
-    return charges
+    charges_ = interchange["Electrostatics"].charges.values()
 
+    return np.fromiter(
+        (charge.m_as(unit.elementary_charge) for charge in charges_),
+        dtype=float,
+        count=len(charges_),
+    )
 
-def _create_torsion_dict(torsion_force) -> dict[tuple[int], list[tuple]]:
-    torsions: DefaultDict = defaultdict(list)
 
-    for i in range(torsion_force.getNumTorsions()):
-        p1, p2, p3, p4, periodicity, phase, k = torsion_force.getTorsionParameters(i)
-        key = (p1, p2, p3, p4)
-        torsions[key]
-        torsions[key].append((periodicity, phase, k))
-
-    return torsions
-
-
-def _create_bond_dict(bond_force):
+@requires_package("openmm")
+def _create_bond_dict(bond_force) -> dict[tuple[int, int], tuple[float, float]]:
+    """Map bond indices to (length, k) in nanometer and kJ/mol/nm**2."""
     bonds = dict()
 
     for i in range(bond_force.getNumBonds()):
         p1, p2, length, k = bond_force.getBondParameters(i)
         key = (p1, p2)
-        bonds[key] = (length, k)
+        bonds[key] = (
+            length.value_in_unit(openmm.unit.nanometer),
+            k.value_in_unit(kj_nm2_mol),
+        )
 
     return bonds
 
 
-def _create_angle_dict(angle_force):
+@requires_package("openmm")
+def _create_angle_dict(
+    angle_force,
+) -> dict[tuple[int, int, int], tuple[float, float]]:
+    """Map angle indices to (theta, k) in radian and kJ/mol/rad**2."""
     angles = dict()
 
     for i in range(angle_force.getNumAngles()):
         p1, p2, p3, theta, k = angle_force.getAngleParameters(i)
         key = (p1, p2, p3)
-        angles[key] = (theta, k)
+        angles[key] = (
+            theta.value_in_unit(openmm.unit.radian),
+            k.value_in_unit(kj_rad2_mol),
+        )
 
     return angles
 
 
+def _get_parameter_differences(parameters1: dict, parameters2: dict) -> np.ndarray:
+    """Return |parameters2 - parameters1| as an (N, 2) array over the keys of parameters1."""
+    missing = parameters1.keys() - parameters2.keys()
+    assert not missing, f"terms missing from second force: {sorted(missing)}"
+
+    keys = [*parameters1]
+
+    array1 = np.array([parameters1[key] for key in keys], dtype=float).reshape(-1, 2)
+    array2 = np.array([parameters2[key] for key in keys], dtype=float).reshape(-1, 2)
+
+    return np.abs(array2 - array1)
+
+
 @requires_package("openmm")
-def _compare_individual_torsions(x, y):
-    assert x[0] == y[0]
-    assert x[1] == y[1]
-    assert (x[2] - y[2]) < 1e-15 * openmm.unit.kilojoule_per_mole
+def _torsions_as_array(torsion_force) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Collect torsion indices and (periodicity, phase, k) into arrays sorted by indices.
+
+    The sort is stable, so multiple terms acting on the same atoms keep their order.
+    """
+    radian = openmm.unit.radian
+    kj_mol = openmm.unit.kilojoule_per_mole
+
+    # Collect plain tuples and convert each list to an array once, rather than
+    # assigning into array rows one torsion at a time
+    indices_: list[tuple[int, ...]] = list()
+    parameters_: list[tuple[float, ...]] = list()
+
+    for p1, p2, p3, p4, periodicity, phase, k in map(
+        torsion_force.getTorsionParameters,
+        range(torsion_force.getNumTorsions()),
+    ):
+        indices_.append((p1, p2, p3, p4))
+        parameters_.append(
+            (periodicity, phase.value_in_unit(radian), k.value_in_unit(kj_mol)),
+        )
+
+    indices = np.array(indices_, dtype=np.int32).reshape(-1, 4)
+    parameters = np.array(parameters_, dtype=float).reshape(-1, 3)
+
+    order = _get_torsion_order(indices)
+
+    return indices[order], parameters[order]
+
+
+def _get_torsion_order(indices: np.ndarray) -> np.ndarray:
+    """Return a stable ordering of an (N, 4) array of torsion indices."""
+    if indices.size == 0 or indices.max() < 2**16:
+        # Pack each row into one 64-bit key so that a single sort replaces four
+        packed = np.zeros(len(indices), dtype=np.uint64)
+
+        for column in range(4):
+            packed = (packed << np.uint64(16)) | indices[:, column].astype(np.uint64)
+
+        return np.argsort(packed, kind="stable")
+
+    return np.lexsort(indices.T[::-1])
 
 
 def _compare_torsion_forces(force1, force2):
-    sorted1 = _create_torsion_dict(torsion_force=force1)
-    sorted2 = _create_torsion_dict(torsion_force=force2)
+    indices1, parameters1 = _torsions_as_array(force1)
+    indices2, parameters2 = _torsions_as_array(force2)
 
-    assert sum(len(v) for v in sorted1.values()) == force1.getNumTorsions()
-    assert sum(len(v) for v in sorted2.values()) == force2.getNumTorsions()
-    assert len(sorted1) == len(sorted2)
+    assert np.array_equal(indices1, indices2), "torsions act on different atoms"
 
-    for key in sorted1:
-        for i in range(len(sorted1[key])):
-            _compare_individual_torsions(sorted1[key][i], sorted2[key][i])
+    assert np.array_equal(
+        parameters1[:, :2],
+        parameters2[:, :2],
+    ), "torsion periodicities or phases differ"
+
+    if parameters1.size > 0:
+        k_diff = np.max(np.abs(parameters2[:, 2] - parameters1[:, 2]))
+        assert k_diff < 1e-12, f"torsion k differ by {k_diff}"
 
 
-@requires_package("openmm")
 def _compare_bond_forces(force1, force2):
     assert force1.getNumBonds() == force2.getNumBonds()
 
     bonds1 = _create_bond_dict(force1)
     bonds2 = _create_bond_dict(force2)
 
-    for key in bonds1:
-        length_diff = bonds2[key][0] - bonds1[key][0]
-        assert (
-            abs(length_diff) < 1e-15 * openmm.unit.nanometer
-        ), f"Bond lengths differ by {length_diff}"
-        k_diff = bonds2[key][1] - bonds1[key][1]
-        assert abs(k_diff) < 1e-9 * kj_nm2_mol, f"bond k differ by {k_diff}"
+    diff = _get_parameter_differences(bonds1, bonds2)
+
+    if diff.size > 0:
+        length_diff, k_diff = diff.max(axis=0)
+        assert length_diff < 1e-15, f"Bond lengths differ by {length_diff} nm"
+        assert k_diff < 1e-9, f"bond k differ by {k_diff} kJ/mol/nm**2"
 
 
-@requires_package("openmm")
 def _compare_angle_forces(force1, force2):
     assert force1.getNumAngles() == force2.getNumAngles()
 
     angles1 = _create_angle_dict(force1)
     angles2 = _create_angle_dict(force2)
 
-    for key in angles1:
-        angle_diff = angles2[key][0] - angles1[key][0]
-        assert (
-            abs(angle_diff) < 1e-15 * openmm.unit.radian
-        ), f"angles differ by {angle_diff}"
-        k_diff = angles2[key][1] - angles1[key][1]
-        assert abs(k_diff) < 1e-10 * kj_rad2_mol, f"angle k differ by {k_diff}"
+    diff = _get_parameter_differences(angles1, angles2)
+
+    if diff.size > 0:
+        angle_diff, k_diff = diff.max(axis=0)
+        assert angle_diff < 1e-15, f"angles differ by {angle_diff} rad"
+        assert k_diff < 1e-10, f"angle k differ by {k_diff} kJ/mol/rad**2"
+
+
+# Getters which need arguments or do not describe global settings of the force
+_SKIPPED_NONBONDED_GETTERS = frozenset(
+    {
+        "getExceptionParameterOffset",
+        "getExceptionParameters",
+        "getGlobalParameterDefaultValue",
+        "getGlobalParameterName",
+        "getLJPMEParametersInContext",
+        "getPMEParametersInContext",
+        "getParticleParameterOffset",
+        "getParticleParameters",
+        "getForceGroup",
+    },
+)
+
+
+@functools.lru_cache(None)
+def _get_nonbonded_settings_getters() -> tuple[str, ...]:
+    """Return the names of the getters used to compare `NonbondedForce` settings."""
+    return tuple(
+        attr
+        for attr in dir(openmm.NonbondedForce)
+        if attr.startswith("get") and attr not in _SKIPPED_NONBONDED_GETTERS
+    )
 
 
 def _compare_nonbonded_settings(force1, force2):
-    for attr in dir(force1):
-        if not attr.startswith("get") or attr in [
-            "getExceptionParameterOffset",
-            "getExceptionParameters",
-            "getGlobalParameterDefaultValue",
-            "getGlobalParameterName",
-            "getLJPMEParametersInContext",
-            "getPMEParametersInContext",
-            "getParticleParameterOffset",
-            "getParticleParameters",
-            "getForceGroup",
-        ]:
-            continue
+    for attr in _get_nonbonded_settings_getters():
         assert getattr(force1, attr)() == getattr(force2, attr)(), attr
 
 
+def _get_nonbonded_parameter_arrays(force) -> tuple[np.ndarray, ...]:
+    """Collect per-particle charges, sigmas, and epsilons into unitless arrays."""
+    n_particles = force.getNumParticles()
+
+    charges = np.empty(n_particles)
+    sigmas = np.empty(n_particles)
+    epsilons = np.empty(n_particles)
+
+    for i in range(n_particles):
+        charge, sigma, epsilon = force.getParticleParameters(i)
+        charges[i] = charge.value_in_unit(openmm.unit.elementary_charge)
+        sigmas[i] = sigma.value_in_unit(openmm.unit.nanometer)
+        epsilons[i] = epsilon.value_in_unit(openmm.unit.kilojoule_per_mole)
+
+    return charges, sigmas, epsilons
+
+
+def _get_exception_parameter_arrays(force) -> tuple[np.ndarray, ...]:
+    """Collect per-exception charge products, sigmas, and epsilons into unitless arrays."""
+    n_exceptions = force.getNumExceptions()
+
+    charge_products = np.empty(n_exceptions)
+    sigmas = np.empty(n_exceptions)
+    epsilons = np.empty(n_exceptions)
+
+    for i in range(n_exceptions):
+        _, _, charge_product, sigma, epsilon = force.getExceptionParameters(i)
+        charge_products[i] = charge_product.value_in_unit(
+            openmm.unit.elementary_charge**2,
+        )
+        sigmas[i] = sigma.value_in_unit(openmm.unit.nanometer)
+        epsilons[i] = epsilon.value_in_unit(openmm.unit.kilojoule_per_mole)
+
+    return charge_products, sigmas, epsilons
+
+
+def _assert_arrays_close(array1, array2, tolerance: float, message: str):
+    """Assert two arrays agree element-wise, reporting the first offending index."""
+    # Written as "not less than" so that NaN differences count as mismatches
+    bad = ~(np.abs(array2 - array1) < tolerance)
+
+    if bad.any():
+        i = int(np.argmax(bad))
+        raise AssertionError(f"{message} {i}: {array1[i]} vs {array2[i]}")
+
+
 @requires_package("openmm")
 def _compare_nonbonded_parameters(force1, force2):
     assert (
         force1.getNumParticles() == force2.getNumParticles()
     ), "found different number of particles"
 
-    for i in range(force1.getNumParticles()):
-        q1, sig1, eps1 = force1.getParticleParameters(i)
-        q2, sig2, eps2 = force2.getParticleParameters(i)
-        assert (
-            abs(q2 - q1) < 1e-8 * openmm.unit.elementary_charge
-        ), f"charge mismatch in particle {i}: {q1} vs {q2}"
-        assert (
-            abs(sig2 - sig1) < 1e-12 * openmm.unit.nanometer
-        ), f"sigma mismatch in particle {i}: {sig1} vs {sig2}"
-        assert (
-            abs(eps2 - eps1) < 1e-12 * openmm.unit.kilojoule_per_mole
-        ), f"epsilon mismatch in particle {i}: {eps1} vs {eps2}"
+    q1, sig1, eps1 = _get_nonbonded_parameter_arrays(force1)
+    q2, sig2, eps2 = _get_nonbonded_parameter_arrays(force2)
+
+    _assert_arrays_close(q1, q2, 1e-8, "charge mismatch in particle")
+    _assert_arrays_close(sig1, sig2, 1e-12, "sigma mismatch in particle")
+    _assert_arrays_close(eps1, eps2, 1e-12, "epsilon mismatch in particle")
 
 
 @requires_package("openmm")
@@ -346,18 +550,12 @@ def _compare_exceptions(force1, force2):
         force1.getNumExceptions() == force2.getNumExceptions()
     ), "found different number of exceptions"
 
-    for i in range(force1.getNumExceptions()):
-        _, _, q1, sig1, eps1 = force1.getExceptionParameters(i)
-        _, _, q2, sig2, eps2 = force2.getExceptionParameters(i)
-        assert (
-            abs(q2 - q1) < 1e-12 * openmm.unit.elementary_charge**2
-        ), f"charge mismatch in exception {i}"
-        assert (
-            abs(sig2 - sig1) < 1e-12 * openmm.unit.nanometer
-        ), f"sigma mismatch in exception {i}"
-        assert (
-            abs(eps2 - eps1) < 1e-12 * openmm.unit.kilojoule_per_mole
-        ), f"epsilon mismatch in exception {i}"
+    q1, sig1, eps1 = _get_exception_parameter_arrays(force1)
+    q2, sig2, eps2 = _get_exception_parameter_arrays(force2)
+
+    _assert_arrays_close(q1, q2, 1e-12, "charge mismatch in exception")
+    _assert_arrays_close(sig1, sig2, 1e-12, "sigma mismatch in exception")
+    _assert_arrays_close(eps1, eps2, 1e-12, "epsilon mismatch in exception")
 
 
 @requires_package("openmm")
@@ -1,4 +1,5 @@
 """Pytest configuration."""
+from copy import deepcopy
 from math import cos, pi, sin
 from random import random
 
@@ -14,16 +15,56 @@ from openff.units import Quantity, unit
 from openff.interchange._tests import get_test_file_path
 
 
-@pytest.fixture()
-def sage():
+@pytest.fixture(autouse=True)
+def _initdir(request, monkeypatch):
+    """Run tests marked with `needs_tmpdir` from inside a temporary directory."""
+    if request.node.get_closest_marker("needs_tmpdir") is not None:
+        # monkeypatch restores the working directory after each test
+        monkeypatch.chdir(request.getfixturevalue("tmp_path"))
+
+
+@pytest.fixture(scope="session")
+def _sage_session() -> ForceField:
     return ForceField("openff-2.0.0.offxml")
 
 
-@pytest.fixture()
-def sage_unconstrained():
+@pytest.fixture(scope="session")
+def _sage_unconstrained_session() -> ForceField:
     return ForceField("openff_unconstrained-2.0.0.offxml")
 
 
+@pytest.fixture(scope="session")
+def _parsley_session() -> ForceField:
+    return ForceField("openff-1.0.0.offxml")
+
+
+@pytest.fixture(scope="session")
+def _tip3p_session() -> ForceField:
+    return ForceField("tip3p.offxml")
+
+
+@pytest.fixture(scope="session")
+def _tip4p_session() -> ForceField:
+    return ForceField("tip4p_fb.offxml")
+
+
+# Parsing force fields is slow, so each is only loaded once per session. Many tests
+# (and fixtures) modify the force field they are given, so hand out copies.
+@pytest.fixture()
+def sage(_sage_session) -> ForceField:
+    return deepcopy(_sage_session)
+
+
+@pytest.fixture()
+def sage_unconstrained(_sage_unconstrained_session) -> ForceField:
+    return deepcopy(_sage_unconstrained_session)
+
+
+@pytest.fixture()
+def parsley(_parsley_session) -> ForceField:
+    return deepcopy(_parsley_session)
+
+
 @pytest.fixture()
 def sage_with_bond_charge(sage):
     sage["Bonds"].add_parameter(
@@ -133,13 +174,13 @@ def _simple_force_field():
 
 
 @pytest.fixture()
-def tip3p() -> ForceField:
-    return ForceField("tip3p.offxml")
+def tip3p(_tip3p_session) -> ForceField:
+    return deepcopy(_tip3p_session)
 
 
 @pytest.fixture()
-def tip4p() -> ForceField:
-    return ForceField("tip4p_fb.offxml")
+def tip4p(_tip4p_session) -> ForceField:
+    return deepcopy(_tip4p_session)
 
 
 @pytest.fixture()
@@ -7,8 +7,6 @@ from openff.utilities import has_package, skip_if_missing
 
 from openff.interchange import Interchange
 from openff.interchange._tests import (
-    HAS_GROMACS,
-    HAS_LAMMPS,
     MoleculeWithConformer,
     _BaseTest,
     get_test_file_path,
@@ -17,21 +15,21 @@ from openff.interchange._tests import (
 )
 from openff.interchange.constants import kj_mol
 from openff.interchange.drivers import get_openmm_energies
+from openff.interchange.drivers.gromacs import (
+    _get_mdp_file,
+    _process,
+    _run_gmx_energy,
+    get_gromacs_energies,
+)
+from openff.interchange.drivers.lammps import get_lammps_energies
 
 if has_package("openmm"):
     import openmm
     import openmm.app
     import openmm.unit
 
-if HAS_GROMACS:
-    from openff.interchange.drivers.gromacs import (
-        _get_mdp_file,
-        _process,
-        _run_gmx_energy,
-        get_gromacs_energies,
-    )
-if HAS_LAMMPS:
-    from openff.interchange.drivers.lammps import get_lammps_energies
+
+pytestmark = pytest.mark.needs_tmpdir
 
 
 @skip_if_missing("foyer")
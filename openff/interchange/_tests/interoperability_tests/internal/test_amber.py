@@ -21,6 +21,9 @@ if has_package("openmm"):
     import openmm.unit
 
 
+pytestmark = pytest.mark.needs_tmpdir
+
+
 class TestAmber(_BaseTest):
     @pytest.mark.skip(reason="Need replacement route to reference positions")
     def test_inpcrd(self, sage):
@@ -36,6 +36,9 @@ if has_package("openmm"):
     import openmm.unit
 
 
+pytestmark = pytest.mark.needs_tmpdir
+
+
 @skip_if_missing("mdtraj")
 @skip_if_missing("openmm")
 @needs_gmx
@@ -7,6 +7,8 @@ from openff.interchange import Interchange
 from openff.interchange._tests import _BaseTest, needs_lmp
 from openff.interchange.drivers import get_lammps_energies, get_openmm_energies
 
+pytestmark = pytest.mark.needs_tmpdir
+
 
 @needs_lmp
 class TestLammps(_BaseTest):
@@ -56,6 +56,9 @@ else:
     nonbonded_methods = list()
 
 
+pytestmark = pytest.mark.needs_tmpdir
+
+
 def _get_num_virtual_sites(openmm_topology: "openmm.app.Topology") -> int:
     return sum(atom.element is None for atom in openmm_topology.atoms())
 
@@ -1,7 +1,10 @@
 """Tests reproducing specific issues that are otherwise uncategorized."""
 import parmed
+import pytest
 from openff.toolkit import ForceField, Molecule
 
+pytestmark = pytest.mark.needs_tmpdir
+
 
 def test_issue_723():
     force_field = ForceField("openff-2.1.0.offxml")
@@ -8,15 +8,16 @@ from openff.units import unit
 from openff.utilities.testing import has_package, skip_if_missing
 
 from openff.interchange import Interchange
-from openff.interchange._tests import (
-    HAS_GROMACS,
-    _BaseTest,
-    get_test_files_dir_path,
-    needs_gmx,
-)
+from openff.interchange._tests import _BaseTest, get_test_files_dir_path, needs_gmx
 from openff.interchange.components.potentials import Potential
 from openff.interchange.constants import kj_mol
 from openff.interchange.drivers import get_openmm_energies
+from openff.interchange.drivers.gromacs import (
+    _get_mdp_file,
+    _process,
+    _run_gmx_energy,
+    get_gromacs_energies,
+)
 from openff.interchange.models import PotentialKey, TopologyKey
 
 if has_package("foyer"):
@@ -24,13 +25,8 @@ if has_package("foyer"):
 
     from openff.interchange.foyer._valence import _RBTorsionHandler
 
-if HAS_GROMACS:
-    from openff.interchange.drivers.gromacs import (
-        _get_mdp_file,
-        _process,
-        _run_gmx_energy,
-        get_gromacs_energies,
-    )
+
+pytestmark = pytest.mark.needs_tmpdir
 
 
 @skip_if_missing("foyer")
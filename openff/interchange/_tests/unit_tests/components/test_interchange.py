@@ -8,11 +8,12 @@ from openff.toolkit.typing.engines.smirnoff.parameters import (
     ParameterHandler,
 )
 from openff.units import unit
-from openff.utilities.testing import skip_if_missing
+from openff.utilities.testing import has_package, skip_if_missing
 
 from openff.interchange import Interchange
 from openff.interchange._tests import (
     _BaseTest,
+    _cached_conformer,
     get_test_file_path,
     needs_gmx,
     needs_lmp,
@@ -28,18 +29,39 @@ from openff.interchange.exceptions import (
     SMIRNOFFHandlersNotImplementedError,
 )
 
+if has_package("openmm"):
+    import openmm
+    import openmm.app
+    import openmm.unit
+
+if has_package("mdtraj"):
+    import mdtraj
+
 try:
     from pydantic.v1 import ValidationError
 except ImportError:
     from pydantic import ValidationError
 
 
+@pytest.fixture(scope="module")
+def _cco_interchange_cached(_sage_session) -> Interchange:
+    return Interchange.from_smirnoff(
+        _sage_session,
+        Molecule.from_smiles("CCO").to_topology(),
+    )
+
+
+@pytest.fixture()
+def cco_interchange(_cco_interchange_cached) -> Interchange:
+    """An Interchange of a single ethanol molecule, without positions, parametrized with Sage."""
+    return deepcopy(_cco_interchange_cached)
+
+
 @pytest.mark.slow()
 class TestInterchange(_BaseTest):
-    def test_getitem(self, sage):
+    def test_getitem(self, cco_interchange):
         """Test behavior of Interchange.__getitem__"""
-        mol = Molecule.from_smiles("CCO")
-        out = Interchange.from_smirnoff(force_field=sage, topology=[mol])
+        out = cco_interchange
 
         out.box = [4, 4, 4]
 
@@ -55,9 +77,8 @@ class TestInterchange(_BaseTest):
         with pytest.raises(LookupError, match="Could not find"):
             out["CMAPs"]
 
-    def test_get_parameters(self, sage):
-        mol = Molecule.from_smiles("CCO")
-        out = Interchange.from_smirnoff(force_field=sage, topology=[mol])
+    def test_get_parameters(self, cco_interchange):
+        out = cco_interchange
 
         from_interchange = out._get_parameters("Bonds", (0, 4))
         from_handler = out["Bonds"]._get_parameters((0, 4))
@@ -106,7 +127,7 @@ class TestInterchange(_BaseTest):
         monkeypatch.setenv("INTERCHANGE_EXPERIMENTAL", "1")
 
         mol = Molecule.from_smiles("C")
-        mol.generate_conformers(n_conformers=1)
+        mol.add_conformer(_cached_conformer("C"))
         top = Topology.from_molecules([mol])
 
         interchange = Interchange.from_smirnoff(sage_unconstrained, top)
@@ -130,11 +151,10 @@ class TestInterchange(_BaseTest):
         thf = Molecule.from_smiles("C1CCOC1")
         ace = Molecule.from_smiles("CC(=O)O")
 
-        thf.generate_conformers(n_conformers=1)
-        ace.generate_conformers(n_conformers=1)
+        thf.add_conformer(_cached_conformer("C1CCOC1"))
+        ace.add_conformer(_cached_conformer("CC(=O)O"))
 
         def make_interchange(molecule: Molecule) -> Interchange:
-            molecule.generate_conformers(n_conformers=1)
             interchange = Interchange.from_smirnoff(
                 force_field=sage_unconstrained,
                 topology=[molecule],
@@ -170,8 +190,8 @@ class TestInterchange(_BaseTest):
         )
         methane_interchange = Interchange.from_smirnoff(sage, [methane])
 
-        ethane.generate_conformers(n_conformers=1)
-        methane.generate_conformers(n_conformers=1)
+        ethane.add_conformer(_cached_conformer("CC"))
+        methane.add_conformer(_cached_conformer("C"))
 
         assert (methane_interchange + ethane_interchange).positions is None
         methane_interchange.positions = methane.conformers[0]
@@ -181,7 +201,7 @@ class TestInterchange(_BaseTest):
 
     def test_input_topology_not_modified(self, sage):
         molecule = Molecule.from_smiles("CCO")
-        molecule.generate_conformers(n_conformers=1)
+        molecule.add_conformer(_cached_conformer("CCO"))
         molecule.conformers[0] += 1 * unit.angstrom
         topology = molecule.to_topology()
         original = list(topology.molecules)[0].conformers[0]
@@ -195,6 +215,7 @@ class TestInterchange(_BaseTest):
     @needs_gmx
     @needs_lmp
     @pytest.mark.slow()
+    @pytest.mark.needs_tmpdir()
     @skip_if_missing("foyer")
     def test_atom_ordering(self):
         """Test that atom indices in bonds are ordered consistently between the slot map and topology"""
@@ -263,18 +284,10 @@ class TestInterchange(_BaseTest):
         assert isinstance(out.topology, Topology)
 
     @skip_if_missing("openmm")
-    def test_to_openmm_simulation(self, sage):
-        import numpy
-        import openmm
-        import openmm.app
-        import openmm.unit
-
+    def test_to_openmm_simulation(self, sage, cco_interchange):
         molecule = Molecule.from_smiles("CCO")
 
-        simulation = Interchange.from_smirnoff(
-            force_field=sage,
-            topology=molecule.to_topology(),
-        ).to_openmm_simulation(
+        simulation = cco_interchange.to_openmm_simulation(
             integrator=openmm.VerletIntegrator(2.0 * openmm.unit.femtosecond),
         )
 
@@ -289,7 +302,7 @@ class TestInterchange(_BaseTest):
 
         del simulation
 
-        molecule.generate_conformers(n_conformers=1)
+        molecule.add_conformer(_cached_conformer("CCO"))
 
         simulation = Interchange.from_smirnoff(
             force_field=sage,
@@ -305,15 +318,12 @@ class TestInterchange(_BaseTest):
 
     @skip_if_missing("nglview")
     @skip_if_missing("openmm")
-    def test_visualize(self, sage):
+    def test_visualize(self, cco_interchange):
         import nglview
 
         molecule = Molecule.from_smiles("CCO")
 
-        out = Interchange.from_smirnoff(
-            force_field=sage,
-            topology=molecule.to_topology(),
-        )
+        out = cco_interchange
 
         with pytest.raises(
             MissingPositionsError,
@@ -321,7 +331,7 @@ class TestInterchange(_BaseTest):
         ):
             out.visualize()
 
-        molecule.generate_conformers(n_conformers=1)
+        molecule.add_conformer(_cached_conformer("CCO"))
         out.positions = molecule.conformers[0]
 
         assert isinstance(out.visualize(), nglview.NGLWidget)
@@ -329,10 +339,9 @@ class TestInterchange(_BaseTest):
 
 @skip_if_missing("openmm")
 @skip_if_missing("mdtraj")
+@pytest.mark.needs_tmpdir()
 class TestToPDB(_BaseTest):
     def test_to_pdb_with_virtual_sites(self, water, tip4p):
-        import mdtraj
-
         tip4p.create_interchange(water.to_topology()).to_pdb(
             "_test.pdb",
             include_virtual_sites=True,
@@ -341,8 +350,6 @@ class TestToPDB(_BaseTest):
         assert mdtraj.load("_test.pdb").topology.n_atoms == 4
 
     def test_tip4p_pdb_dummy_particle_position(self, water_tip4p, tip4p):
-        import mdtraj
-
         tip4p.create_interchange(water_tip4p.to_topology()).to_pdb(
             "_test.pdb",
             include_virtual_sites=True,
@@ -360,8 +367,6 @@ class TestToPDB(_BaseTest):
         )
 
     def test_to_pdb_ignoring_virtual_sites(self, water, tip4p):
-        import mdtraj
-
         tip4p.create_interchange(water.to_topology()).to_pdb(
             "_test.pdb",
             include_virtual_sites=False,
@@ -408,6 +413,7 @@ class TestBadExports(_BaseTest):
         ):
             Interchange.from_smirnoff(force_field=sage, topology=top)
 
+    @pytest.mark.needs_tmpdir()
     def test_gro_file_no_positions(self, sage):
         no_positions = Interchange.from_smirnoff(
             force_field=sage,
@@ -416,6 +422,7 @@ class TestBadExports(_BaseTest):
         with pytest.raises(MissingPositionsError, match="Positions are req"):
             no_positions.to_gro("foo.gro")
 
+    @pytest.mark.needs_tmpdir()
     def test_gro_file_all_zero_positions(self, sage):
         zero_positions = Interchange.from_smirnoff(
             force_field=sage,
@@ -432,6 +439,7 @@ class TestBadExports(_BaseTest):
 @skip_if_missing("openmm")
 class TestInterchangeSerialization(_BaseTest):
     def test_json_roundtrip(self, sage, water, ethanol):
+        # The water fixture already carries a conformer
         topology = Topology.from_molecules(
             [
                 water,
@@ -439,9 +447,6 @@ class TestInterchangeSerialization(_BaseTest):
             ],
         )
 
-        for molecule in topology.molecules:
-            molecule.generate_conformers(n_conformers=1)
-
         topology.box_vectors = unit.Quantity([4, 4, 4], unit.nanometer)
 
         original = Interchange.from_smirnoff(
@@ -459,14 +464,22 @@ class TestInterchangeSerialization(_BaseTest):
 class TestWrappedCalls(_BaseTest):
     """Test that methods which delegate out to other submodules call them."""
 
-    @pytest.fixture()
-    def simple_interchange(self, sage):
+    # None of these tests modify the Interchange or its exports, so build them once
+    @pytest.fixture(scope="class")
+    def simple_interchange(self, _sage_session):
         mol = Molecule.from_smiles("CCO")
         mol.generate_conformers(n_conformers=1)
         top = mol.to_topology()
         top.box_vectors = unit.Quantity(numpy.eye(3) * 4, unit.nanometer)
 
-        return Interchange.from_smirnoff(force_field=sage, topology=top)
+        return Interchange.from_smirnoff(force_field=_sage_session, topology=top)
+
+    @pytest.fixture(scope="class")
+    def simple_openmm_export(self, simple_interchange):
+        return (
+            simple_interchange.to_openmm_topology(),
+            simple_interchange.to_openmm(),
+        )
 
     @skip_if_missing("openmm")
     def test_from_openmm_error(self):
@@ -479,11 +492,15 @@ class TestWrappedCalls(_BaseTest):
 
     @skip_if_missing("openmm")
     @pytest.mark.slow()
-    def test_from_openmm_called(self, monkeypatch, simple_interchange):
+    def test_from_openmm_called(
+        self,
+        monkeypatch,
+        simple_interchange,
+        simple_openmm_export,
+    ):
         monkeypatch.setenv("INTERCHANGE_EXPERIMENTAL", "1")
 
-        topology = simple_interchange.to_openmm_topology()
-        system = simple_interchange.to_openmm()
+        topology, system = simple_openmm_export
         positions = simple_interchange.positions
         box = simple_interchange.box
 
@@ -494,6 +511,7 @@ class TestWrappedCalls(_BaseTest):
             box_vectors=box,
         )
 
+    @pytest.mark.needs_tmpdir()
     def test_from_gromacs_called(self, monkeypatch, simple_interchange):
         monkeypatch.setenv("INTERCHANGE_EXPERIMENTAL", "1")
 
@@ -12,6 +12,8 @@ from openff.interchange.components.mdconfig import (
 )
 from openff.interchange.constants import _PME
 
+pytestmark = pytest.mark.needs_tmpdir
+
 
 @pytest.fixture()
 def system_no_constraints(sage_unconstrained, basic_top):
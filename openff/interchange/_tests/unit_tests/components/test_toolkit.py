@@ -91,6 +91,12 @@ class TestToolkitUtils(_BaseTest):
                 attr,
             )
 
+        for molecule in combined.molecules:
+            assert all(
+                molecule is not other
+                for other in [*ethanol_topology.molecules, *water_topology.molecules]
+            )
+
     @skip_if_missing("openmm")
     def test_simple_topology_from_openmm(self):
         simple_topology = _simple_topology_from_openmm(
@@ -23,6 +23,8 @@ from openff.interchange.drivers.all import get_all_energies, get_summary_data
 from openff.interchange.drivers.gromacs import _find_gromacs_executable
 from openff.interchange.drivers.lammps import _find_lammps_executable
 
+pytestmark = pytest.mark.needs_tmpdir
+
 
 @skip_if_missing("openmm")
 @pytest.mark.slow()
@@ -11,6 +11,9 @@ if has_package("openmm"):
     import openmm.app
 
 
+pytestmark = pytest.mark.needs_tmpdir
+
+
 @pytest.mark.slow()
 @requires_openeye
 @pytest.mark.parametrize(
@@ -13,6 +13,9 @@ if has_package("openmm"):
     import openmm.unit
 
 
+pytestmark = pytest.mark.needs_tmpdir
+
+
 class TestToGro(_BaseTest):
     def test_residue_names(self, sage):
         """Reproduce issue #642."""
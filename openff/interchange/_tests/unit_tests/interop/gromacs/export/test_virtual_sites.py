@@ -4,6 +4,8 @@ from openff.utilities.testing import skip_if_missing
 
 from openff.interchange._tests import MoleculeWithConformer
 
+pytestmark = pytest.mark.needs_tmpdir
+
 # Some of these tests are basically copied from [1] with an extra step into GROMACS files on disk.  Might be useful to
 # collapse these in order to avoid divergence in the future.
 # [1] unit_tests/interop/openmm/test_virtual_sites.py
@@ -18,6 +18,9 @@ except ModuleNotFoundError:
     from pydantic import ValidationError
 
 
+pytestmark = pytest.mark.needs_tmpdir
+
+
 @pytest.fixture()
 def molecule1():
     molecule = Molecule.from_smiles(
@@ -87,6 +87,7 @@ class TestOpenMM(_BaseTest):
             decimal=8,
         )
 
+    @pytest.mark.needs_tmpdir()
     def test_to_pdb_box_vectors(self, sage):
         """Reproduce https://github.com/openforcefield/openff-interchange/issues/548."""
         from openmm.app import PDBFile
@@ -108,6 +108,8 @@ class TestNonbonded(_BaseTest):
 
         Taken from https://github.com/openforcefield/openff-toolkit/pull/1214,
         """
+        hexane_diol = hexane_diol()
+
         try:
             hexane_diol.assign_partial_charges(partial_charge_method="am1bccelf10")
             uses_elf10 = True
@@ -227,6 +229,7 @@ class TestSMIRNOFFChargeIncrements(_BaseTest):
         return handler
 
     def test_no_charge_increments_applied(self, sage, hexane_diol):
+        hexane_diol = hexane_diol()
         gastiger_charges = [c.m for c in hexane_diol.partial_charges]
         sage.deregister_parameter_handler("ToolkitAM1BCC")
 
@@ -1,5 +1,6 @@
 """An object for storing, manipulating, and converting molecular mechanics data."""
 import copy
+import itertools
 import json
 import warnings
 from pathlib import Path
@@ -128,6 +129,48 @@ def interchange_loader(data: str) -> dict:
     return tmp
 
 
+# Non-collection components that can be looked up with `Interchange.__getitem__`,
+# mapped to the names of the attributes that store them
+_COMPONENT_ATTRIBUTES: dict[str, str] = {
+    "positions": "positions",
+    "box": "box",
+    "box_vectors": "box",
+}
+
+
+def _shift_key_map(key_map: dict, atom_offset: int) -> dict:
+    """Copy a key map, shifting the atom indices of each topology key by `atom_offset`."""
+    top_keys = list(key_map)
+    lengths = [len(top_key.atom_indices) for top_key in top_keys]
+
+    atom_indices = np.fromiter(
+        itertools.chain.from_iterable(top_key.atom_indices for top_key in top_keys),
+        dtype=np.int64,
+        count=sum(lengths),
+    )
+    atom_indices += atom_offset
+
+    shifted_indices = atom_indices.tolist()
+
+    new_key_map = dict()
+    start = 0
+
+    for top_key, length in zip(top_keys, lengths):
+        new_atom_indices = tuple(shifted_indices[start : start + length])
+        start += length
+
+        new_top_key = top_key.__class__(**top_key.dict())
+        try:
+            new_top_key.atom_indices = new_atom_indices
+        except ValueError:
+            assert len(new_atom_indices) == 1
+            new_top_key.this_atom_index = new_atom_indices[0]
+
+        new_key_map[new_top_key] = key_map[top_key]
+
+    return new_key_map
+
+
 class Interchange(DefaultModel):
     """
     A object for storing, manipulating, and converting molecular mechanics data.
@@ -689,16 +732,15 @@ class Interchange(DefaultModel):
             f"Could not find parameter handler of name {handler_name}",
         )
 
-    def __getattr__(self, attr: str):
-        if attr == "handlers":
-            warnings.warn(
-                "The `handlers` attribute is deprecated. Use `collections` instead.",
-                InterchangeDeprecationWarning,
-                stacklevel=2,
-            )
-            return self.collections
-        else:
-            return super().__getattribute__(attr)
+    @property
+    def handlers(self) -> dict[str, Collection]:
+        """Deprecated alias of `collections`."""
+        warnings.warn(
+            "The `handlers` attribute is deprecated. Use `collections` instead.",
+            InterchangeDeprecationWarning,
+            stacklevel=2,
+        )
+        return self.collections
 
     @overload
     def __getitem__(self, item: Literal["Bonds"]) -> "BondCollection":
@@ -761,17 +803,18 @@ class Interchange(DefaultModel):
                 "Only str arguments can be currently be used for lookups.\n"
                 f"Found item {item} of type {type(item)}",
             )
-        if item == "positions":
-            return self.positions
-        elif item in {"box", "box_vectors"}:
-            return self.box
-        elif item in self.collections:
+        attribute = _COMPONENT_ATTRIBUTES.get(item)
+
+        if attribute is not None:
+            return getattr(self, attribute)
+
+        try:
             return self.collections[item]
-        else:
+        except KeyError as error:
             raise LookupError(
                 f"Could not find component {item}. This object has the following "
                 f"collections registered:\n\t{[*self.collections.keys()]}",
-            )
+            ) from error
 
     @experimental
     def __add__(self, other):
@@ -786,7 +829,9 @@ class Interchange(DefaultModel):
             stacklevel=2,
         )
 
-        self_copy = copy.deepcopy(self)
+        # The topology is replaced by the combined topology immediately after, so put it
+        # in the memo to skip deep-copying it only to throw the copy away
+        self_copy = copy.deepcopy(self, memo={id(self.topology): self.topology})
 
         self_copy.topology = _combine_topologies(self.topology, other.topology)
         atom_offset = self.topology.n_atoms
@@ -812,32 +857,25 @@ class Interchange(DefaultModel):
                 )
                 continue
 
-            for top_key, pot_key in handler.key_map.items():
-                new_atom_indices = tuple(
-                    idx + atom_offset for idx in top_key.atom_indices
-                )
-                new_top_key = top_key.__class__(**top_key.dict())
-                try:
-                    new_top_key.atom_indices = new_atom_indices
-                except ValueError:
-                    assert len(new_atom_indices) == 1
-                    new_top_key.this_atom_index = new_atom_indices[0]
-
-                self_handler.key_map.update({new_top_key: pot_key})
-                if handler_name == "Constraints":
-                    self_handler.potentials.update(
-                        {pot_key: handler.potentials[pot_key]},
-                    )
-                else:
-                    self_handler.potentials.update(
-                        {pot_key: handler.potentials[pot_key]},
-                    )
+            self_handler.key_map.update(_shift_key_map(handler.key_map, atom_offset))
+            self_handler.potentials.update(
+                {
+                    pot_key: handler.potentials[pot_key]
+                    for pot_key in handler.key_map.values()
+                },
+            )
 
             self_copy.collections[handler_name] = self_handler
 
         if self_copy.positions is not None and other.positions is not None:
-            new_positions = np.vstack([self_copy.positions, other.positions])
-            self_copy.positions = new_positions
+            # Fill one preallocated buffer rather than letting np.vstack stack copies of each
+            n_self = len(self_copy.positions)
+
+            new_positions = np.empty((n_self + len(other.positions), 3))
+            new_positions[:n_self] = self_copy.positions.m_as(unit.nanometer)
+            new_positions[n_self:] = other.positions.m_as(unit.nanometer)
+
+            self_copy.positions = unit.Quantity(new_positions, unit.nanometer)
         else:
             warnings.warn(
                 "Setting positions to None because one or both objects added together were missing positions.",
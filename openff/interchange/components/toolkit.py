@@ -70,9 +70,9 @@ def _validated_list_to_array(validated_list: "ValidatedList") -> "Quantity":
 
 def _combine_topologies(topology1: Topology, topology2: Topology) -> Topology:
     topology1_ = Topology(other=topology1)
-    topology2_ = Topology(other=topology2)
 
-    for molecule in topology2_.molecules:
+    # `Topology.add_molecule` stores a copy of each molecule, so `topology2` need not be copied
+    for molecule in topology2.molecules:
         topology1_.add_molecule(molecule)
 
     return topology1_
@@ -341,6 +341,51 @@ def _get_separation_by_atom_indices(
     raise ValueError(f"Could not find distance between atoms {atom_indices}")
 
 
+def _get_separations_by_atom_indices(
+    interchange: Interchange,
+) -> dict[tuple[int, int], float]:
+    """
+    Return the distances, in nanometers, between all constrained or bonded pairs of atoms.
+
+    Pairs are keyed by sorted atom indices. As in `_get_separation_by_atom_indices`,
+    constraint distances take precedence over equilibrium bond lengths. Building this once
+    is much cheaper than repeatedly calling `_get_separation_by_atom_indices`, which searches
+    every key each time, and units are stripped here so that callers can work with floats.
+    """
+    separations: dict[tuple[int, int], float] = dict()
+
+    for collection_name, parameter_name in (
+        ("Bonds", "length"),
+        ("Constraints", "distance"),
+    ):
+        if collection_name not in interchange.collections:
+            continue
+
+        collection = interchange[collection_name]
+
+        # Many pairs share a potential, so only convert each potential's distance once
+        distances = {
+            potential_key: potential.parameters[parameter_name].m_as(unit.nanometer)
+            for potential_key, potential in collection.potentials.items()
+        }
+
+        for key, potential_key in collection.key_map.items():
+            separations[tuple(sorted(key.atom_indices))] = distances[potential_key]
+
+    return separations
+
+
+def _lookup_separation(
+    separations: dict[tuple[int, int], float],
+    atom_indices: Iterable[int],
+) -> float:
+    """Look up the distance (nm) between two atoms in the output of `_get_separations_by_atom_indices`."""
+    try:
+        return separations[tuple(sorted(atom_indices))]
+    except KeyError:
+        raise ValueError(f"Could not find distance between atoms {atom_indices}")
+
+
 def _get_angle_by_atom_indices(
     interchange: Interchange,
     atom_indices: Iterable[int],
@@ -538,6 +538,8 @@ def to_prmtop(interchange: "Interchange", file_path: Union[Path, str]):
 
         nonbonded_parm_indices: list[Optional[int]] = [None] * (NTYPES * NTYPES)
 
+        vdw_potentials = interchange["vdW"].potentials
+
         for key_i, i in potential_key_to_atom_type_mapping.items():
             for key_j, j in potential_key_to_atom_type_mapping.items():
                 if j < i:
@@ -559,10 +561,10 @@ def to_prmtop(interchange: "Interchange", file_path: Union[Path, str]):
 
                 # TODO: Figure out the right way to map cross-interactions, using the
                 #       key_i and key_j objects as lookups to parameters
-                sigma_i = interchange["vdW"].potentials[key_i].parameters["sigma"]
-                sigma_j = interchange["vdW"].potentials[key_j].parameters["sigma"]
-                epsilon_i = interchange["vdW"].potentials[key_i].parameters["epsilon"]
-                epsilon_j = interchange["vdW"].potentials[key_j].parameters["epsilon"]
+                sigma_i = vdw_potentials[key_i].parameters["sigma"]
+                sigma_j = vdw_potentials[key_j].parameters["sigma"]
+                epsilon_i = vdw_potentials[key_i].parameters["epsilon"]
+                epsilon_j = vdw_potentials[key_j].parameters["epsilon"]
 
                 sigma = (sigma_i + sigma_j) * 0.5
                 epsilon = (epsilon_i * epsilon_j) ** 0.5
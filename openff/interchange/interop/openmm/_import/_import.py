@@ -130,6 +130,7 @@ def _convert_constraints(
 def _convert_nonbonded_force(
     force: "openmm.NonbondedForce",
 ) -> tuple[vdWCollection, BasicElectrostaticsCollection]:
+    from openff.units import unit
     from openff.units.openmm import from_openmm as from_openmm_quantity
 
     from openff.interchange.components.potentials import Potential
@@ -143,24 +144,39 @@ def _convert_nonbonded_force(
     vdw = vdWCollection()
     electrostatics = BasicElectrostaticsCollection(version=0.4, scale_14=0.833333)
 
-    n_parametrized_particles = force.getNumParticles()
+    # Strip OpenMM units with value_in_unit, which is much cheaper than converting each
+    # openmm.unit.Quantity to a pint Quantity, and attach OpenFF units to the floats
+    _nm = openmm.unit.nanometer
+    _kj_mol = openmm.unit.kilojoule_per_mole
+    _e = openmm.unit.elementary_charge
+
+    particle_parameters = [
+        (
+            charge.value_in_unit(_e),
+            sigma.value_in_unit(_nm),
+            epsilon.value_in_unit(_kj_mol),
+        )
+        for charge, sigma, epsilon in map(
+            force.getParticleParameters,
+            range(force.getNumParticles()),
+        )
+    ]
 
-    for idx in range(n_parametrized_particles):
-        charge, sigma, epsilon = force.getParticleParameters(idx)
+    for idx, (charge, sigma, epsilon) in enumerate(particle_parameters):
         top_key = TopologyKey(atom_indices=(idx,))
         pot_key = PotentialKey(id=f"{idx}")
-        pot = Potential(
+
+        vdw.key_map[top_key] = pot_key
+        vdw.potentials[pot_key] = Potential(
             parameters={
-                "sigma": from_openmm_quantity(sigma),
-                "epsilon": from_openmm_quantity(epsilon),
+                "sigma": sigma * unit.nanometer,
+                "epsilon": epsilon * unit.kilojoule / unit.mol,
             },
         )
-        vdw.key_map.update({top_key: pot_key})
-        vdw.potentials.update({pot_key: pot})
 
-        electrostatics.key_map.update({top_key: pot_key})
-        electrostatics.potentials.update(
-            {pot_key: Potential(parameters={"charge": from_openmm_quantity(charge)})},
+        electrostatics.key_map[top_key] = pot_key
+        electrostatics.potentials[pot_key] = Potential(
+            parameters={"charge": charge * unit.elementary_charge},
         )
 
     if force.getNonbondedMethod() == 4:
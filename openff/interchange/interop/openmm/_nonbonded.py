@@ -19,7 +19,7 @@ from openff.interchange.exceptions import (
     UnsupportedExportError,
 )
 from openff.interchange.interop.common import _build_particle_map
-from openff.interchange.models import TopologyKey, VirtualSiteKey
+from openff.interchange.models import PotentialKey, TopologyKey, VirtualSiteKey
 
 if has_package("openmm"):
     import openmm
@@ -162,6 +162,11 @@ def _add_particles_to_system(
         molecule_virtual_site_map,
     )
 
+    separations: Optional[dict[tuple[int, int], float]] = None
+
+    if any(molecule_virtual_site_map.values()):
+        virtual_sites = interchange["VirtualSites"]
+
     for molecule in interchange.topology.molecules:
         for atom in molecule.atoms:
             atom_index = interchange.topology.atom_index(atom)
@@ -174,6 +179,9 @@ def _add_particles_to_system(
         for virtual_site_key in molecule_virtual_site_map[
             interchange.topology.molecule_index(molecule)
         ]:
+            from openff.interchange.interop._virtual_sites import (
+                _get_separations_by_atom_indices,
+            )
             from openff.interchange.interop.common import _create_virtual_site_object
             from openff.interchange.interop.openmm._virtual_sites import (
                 _create_openmm_virtual_site,
@@ -183,8 +191,11 @@ def _add_particles_to_system(
 
             assert system_index == particle_map[virtual_site_key]
 
-            virtual_site_potential = interchange["VirtualSites"].potentials[
-                interchange["VirtualSites"].key_map[virtual_site_key]
+            if separations is None:
+                separations = _get_separations_by_atom_indices(interchange)
+
+            virtual_site_potential = virtual_sites.potentials[
+                virtual_sites.key_map[virtual_site_key]
             ]
 
             virtual_site_object = _create_virtual_site_object(
@@ -196,6 +207,7 @@ def _add_particles_to_system(
                 interchange,
                 virtual_site_object,
                 particle_map,
+                separations,
             )
 
             system.setVirtualSite(system_index, openmm_particle)
@@ -344,49 +356,29 @@ def _create_single_nonbonded_force(
                 f"`combine_nonbonded_forces=True` and `.box={interchange.box}`.",
             )
 
-    if data.electrostatics_collection is not None:
-        partial_charges = data.electrostatics_collection.charges
-
     # mapping between (openmm) index of each atom and the (openmm) index of each virtual particle
     #   of that parent atom (if any)
     # if no virtual sites at all, this remains an empty dict
     parent_virtual_particle_mapping: DefaultDict[int, list[int]] = defaultdict(list)
 
-    vdw = data.vdw_collection
+    separations: Optional[dict[tuple[int, int], float]] = None
+    if has_virtual_sites:
+        virtual_sites = interchange["VirtualSites"]
+        vdw = interchange["vdW"]
+        coul = interchange["Electrostatics"]
+
+    atom_parameters = _get_atom_nonbonded_parameters(data, interchange.topology.n_atoms)
 
     for molecule in interchange.topology.molecules:
         for atom in molecule.atoms:
-            non_bonded_force.addParticle(0.0, 1.0, 0.0)
-
             atom_index = interchange.topology.atom_index(atom)
 
-            top_key = TopologyKey(atom_indices=(atom_index,))
-
-            if data.electrostatics_collection is not None:
-                partial_charge = partial_charges[top_key].m_as(unit.e)
-            else:
-                partial_charge = 0.0
-
-            if vdw is not None:
-                pot_key = vdw.key_map[top_key]
-
-                sigma = vdw.potentials[pot_key].parameters["sigma"]
-                epsilon = vdw.potentials[pot_key].parameters["epsilon"]
+            force_index = non_bonded_force.addParticle(*atom_parameters[atom_index])
 
-                sigma = sigma.m_as(unit.nanometer)
-                epsilon = epsilon.m_as(unit.kilojoule / unit.mol)
-            else:
-                sigma = openmm.unit.Quantity(0.0, openmm.unit.nanometer)
-                epsilon = openmm.unit.Quantity(0.0, openmm.unit.kilojoules_per_mole)
-
-            openmm_atom_index = openff_openmm_particle_map[atom_index]
-
-            non_bonded_force.setParticleParameters(
-                openmm_atom_index,
-                partial_charge,
-                sigma,
-                epsilon,
-            )
+            if openff_openmm_particle_map[atom_index] != force_index:
+                raise InternalInconsistencyError(
+                    "Mismatch in system and force indexing",
+                )
 
         if has_virtual_sites:
             molecule_index = interchange.topology.molecule_index(molecule)
@@ -395,15 +387,19 @@ def _create_single_nonbonded_force(
 
         for virtual_site_key in molecule_virtual_site_map[molecule_index]:
             # TODO: Move this function to openff/interchange/interop/_particles.py ?
+            from openff.interchange.interop._virtual_sites import (
+                _get_separations_by_atom_indices,
+            )
             from openff.interchange.interop.common import _create_virtual_site_object
             from openff.interchange.interop.openmm._virtual_sites import (
                 _create_openmm_virtual_site,
             )
 
-            _potential_key = interchange["VirtualSites"].key_map[virtual_site_key]
-            virtual_site_potential = interchange["VirtualSites"].potentials[
-                _potential_key
-            ]
+            if separations is None:
+                separations = _get_separations_by_atom_indices(interchange)
+
+            _potential_key = virtual_sites.key_map[virtual_site_key]
+            virtual_site_potential = virtual_sites.potentials[_potential_key]
             virtual_site_object = _create_virtual_site_object(
                 virtual_site_key,
                 virtual_site_potential,
@@ -413,11 +409,9 @@ def _create_single_nonbonded_force(
                 interchange,
                 virtual_site_object,
                 openff_openmm_particle_map,
+                separations,
             )
 
-            vdw = interchange["vdW"]
-            coul = interchange["Electrostatics"]
-
             vdw_key = vdw.key_map.get(virtual_site_key)
             coul_key = coul.key_map.get(virtual_site_key)
             if vdw_key is None or coul_key is None:
@@ -927,6 +921,9 @@ def _set_particle_parameters(
 
     vdw: "vdWCollection" = data.vdw_collection
 
+    if vdw is not None and not vdw.is_plugin:
+        lj_parameters = _get_lj_parameters(vdw)
+
     for molecule in interchange.topology.molecules:
         for atom in molecule.atoms:
             atom_index = interchange.topology.atom_index(atom)
@@ -954,11 +951,7 @@ def _set_particle_parameters(
                         parameters = {key: val.m for key, val in parameters.items()}
 
                 else:
-                    sigma = vdw.potentials[pot_key].parameters["sigma"]
-                    epsilon = vdw.potentials[pot_key].parameters["epsilon"]
-
-                    sigma = sigma.m_as(unit.nanometer)
-                    epsilon = epsilon.m_as(unit.kilojoule / unit.mol)
+                    sigma, epsilon = lj_parameters[pot_key]
             else:
                 sigma = openmm.unit.Quantity(0.0, openmm.unit.nanometer)
                 epsilon = openmm.unit.Quantity(0.0, openmm.unit.kilojoules_per_mole)
@@ -998,6 +991,50 @@ def _set_particle_parameters(
                 )
 
 
+def _get_lj_parameters(
+    vdw: "vdWCollection",
+) -> dict[PotentialKey, tuple[float, float]]:
+    """Convert sigma (nm) and epsilon (kJ/mol) once per potential, not once per particle."""
+    return {
+        pot_key: (
+            potential.parameters["sigma"].m_as(unit.nanometer),
+            potential.parameters["epsilon"].m_as(unit.kilojoule / unit.mol),
+        )
+        for pot_key, potential in vdw.potentials.items()
+    }
+
+
+def _get_atom_nonbonded_parameters(
+    data: _NonbondedData,
+    n_atoms: int,
+) -> list[tuple[float, float, float]]:
+    """Get the charge (e), sigma (nm), and epsilon (kJ/mol) of each atom, in topology order."""
+    if data.electrostatics_collection is not None:
+        partial_charges = data.electrostatics_collection.charges
+
+        charges = [
+            partial_charges[TopologyKey(atom_indices=(atom_index,))].m_as(unit.e)
+            for atom_index in range(n_atoms)
+        ]
+    else:
+        charges = [0.0] * n_atoms
+
+    vdw = data.vdw_collection
+
+    if vdw is not None:
+        lj_parameters = _get_lj_parameters(vdw)
+
+        return [
+            (
+                charge,
+                *lj_parameters[vdw.key_map[TopologyKey(atom_indices=(atom_index,))]],
+            )
+            for atom_index, charge in enumerate(charges)
+        ]
+    else:
+        return [(charge, 0.0, 0.0) for charge in charges]
+
+
 def _get_14_scaling_factors(data: _NonbondedData) -> tuple[float, float]:
     if data.electrostatics_collection is None:
         coul_14 = 1.0
@@ -8,7 +8,7 @@ from openff.units.openmm import to_openmm as to_openmm_quantity
 from openff.utilities.utilities import has_package
 
 from openff.interchange.exceptions import UnsupportedExportError
-from openff.interchange.models import VirtualSiteKey
+from openff.interchange.models import PotentialKey, VirtualSiteKey
 
 if has_package("openmm"):
     import openmm
@@ -29,13 +29,16 @@ def _process_constraints(
 
     constrained_pairs: set[tuple[int, ...]] = set()
 
+    distances: dict[PotentialKey, float] = {
+        pot_key: potential.parameters["distance"].m_as(off_unit.nanometer)
+        for pot_key, potential in constraint_handler.potentials.items()
+    }
+
     for top_key, pot_key in constraint_handler.key_map.items():
         openff_indices = top_key.atom_indices
         openmm_indices = tuple(particle_map[index] for index in openff_indices)
 
-        params = constraint_handler.potentials[pot_key].parameters
-        distance = params["distance"]
-        distance_omm = distance.m_as(off_unit.nanometer)
+        distance_omm = distances[pot_key]
 
         constrained_pairs.add(tuple(sorted(openmm_indices)))
         openmm_sys.addConstraint(
@@ -74,11 +77,27 @@ def _process_bond_forces(
 
     has_constraint_handler = "Constraints" in interchange.collections
 
+    # Many bonds share a potential, so only convert each potential's parameters once
+    bond_parameters: dict[PotentialKey, tuple[float, float]] = {
+        pot_key: (
+            potential.parameters["length"].m_as(off_unit.nanometer),
+            potential.parameters["k"].m_as(
+                off_unit.kilojoule / off_unit.nanometer**2 / off_unit.mol,
+            ),
+        )
+        for pot_key, potential in bond_handler.potentials.items()
+    }
+
+    skip_constrained = has_constraint_handler and not add_constrained_forces
+
+    # Local aliases keep attribute lookups out of the loop, which runs once per bond
+    get_particle_index = particle_map.__getitem__
+    add_bond = harmonic_bond_force.addBond
+
     for top_key, pot_key in bond_handler.key_map.items():
-        openff_indices = top_key.atom_indices
-        openmm_indices = tuple(particle_map[index] for index in openff_indices)
+        openmm_indices = tuple(map(get_particle_index, top_key.atom_indices))
 
-        if has_constraint_handler and not add_constrained_forces:
+        if skip_constrained:
             if _is_constrained(
                 constrained_pairs,
                 (openmm_indices[0], openmm_indices[1]),
@@ -86,18 +105,7 @@ def _process_bond_forces(
                 # This bond's length is constrained, dpo so not add a bond force
                 continue
 
-        params = bond_handler.potentials[pot_key].parameters
-        k = params["k"].m_as(
-            off_unit.kilojoule / off_unit.nanometer**2 / off_unit.mol,
-        )
-        length = params["length"].m_as(off_unit.nanometer)
-
-        harmonic_bond_force.addBond(
-            particle1=openmm_indices[0],
-            particle2=openmm_indices[1],
-            length=length,
-            k=k,
-        )
+        add_bond(openmm_indices[0], openmm_indices[1], *bond_parameters[pot_key])
 
 
 def _process_angle_forces(
@@ -135,11 +143,38 @@ def _process_angle_forces(
 
     has_constraint_handler = "Constraints" in interchange.collections
 
+    # Many angles share a potential, so only convert each potential's parameters once
+    angle_parameters: dict[PotentialKey, Union[list, tuple[float, float]]]
+
+    if custom:
+        angle_parameters = {
+            pot_key: [
+                to_openmm_quantity(potential.parameters[val])
+                for val in angle_handler.potential_parameters()
+            ]
+            for pot_key, potential in angle_handler.potentials.items()
+        }
+    else:
+        angle_parameters = {
+            pot_key: (
+                potential.parameters["angle"].m_as(off_unit.radian),
+                potential.parameters["k"].m_as(
+                    off_unit.kilojoule / off_unit.rad / off_unit.mol,
+                ),
+            )
+            for pot_key, potential in angle_handler.potentials.items()
+        }
+
+    skip_constrained = has_constraint_handler and not add_constrained_forces
+
+    # Local aliases keep attribute lookups out of the loop, which runs once per angle
+    get_particle_index = particle_map.__getitem__
+    add_angle = harmonic_angle_force.addAngle
+
     for top_key, pot_key in angle_handler.key_map.items():
-        openff_indices = top_key.atom_indices
-        openmm_indices = tuple(particle_map[index] for index in openff_indices)
+        openmm_indices = tuple(map(get_particle_index, top_key.atom_indices))
 
-        if has_constraint_handler and not add_constrained_forces:
+        if skip_constrained:
             if _is_constrained(
                 constrained_pairs,
                 (openmm_indices[0], openmm_indices[2]),
@@ -157,31 +192,9 @@ def _process_angle_forces(
                         continue
 
         if custom:
-            params = angle_handler.potentials[pot_key].parameters
-            parameter_values = [
-                to_openmm_quantity(params[val])
-                for val in angle_handler.potential_parameters()
-            ]
-
-            harmonic_angle_force.addAngle(
-                openmm_indices[0],
-                openmm_indices[1],
-                openmm_indices[2],
-                parameter_values,
-            )
-
+            add_angle(*openmm_indices, angle_parameters[pot_key])
         else:
-            params = angle_handler.potentials[pot_key].parameters
-            k = params["k"].m_as(off_unit.kilojoule / off_unit.rad / off_unit.mol)
-            angle = params["angle"].m_as(off_unit.radian)
-
-            harmonic_angle_force.addAngle(
-                particle1=openmm_indices[0],
-                particle2=openmm_indices[1],
-                particle3=openmm_indices[2],
-                angle=angle,
-                k=k,
-            )
+            add_angle(*openmm_indices, *angle_parameters[pot_key])
 
 
 def _process_torsion_forces(interchange, openmm_sys, particle_map):
@@ -200,10 +213,10 @@ def _process_proper_torsion_forces(interchange, openmm_sys, particle_map):
 
     proper_torsion_handler = interchange["ProperTorsions"]
 
-    for top_key, pot_key in proper_torsion_handler.key_map.items():
-        openff_indices = top_key.atom_indices
-        openmm_indices = tuple(particle_map[index] for index in openff_indices)
+    # Only convert the parameters of each potential in use once
+    torsion_parameters: dict[PotentialKey, tuple[int, float, float]] = dict()
 
+    for pot_key in dict.fromkeys(proper_torsion_handler.key_map.values()):
         params = proper_torsion_handler.potentials[pot_key].parameters
 
         k = params["k"].m_as(off_unit.kilojoule / off_unit.mol)
@@ -227,14 +240,19 @@ def _process_proper_torsion_forces(interchange, openmm_sys, particle_map):
         idivf = params["idivf"].m_as(off_unit.dimensionless)
         if idivf == 0:
             raise RuntimeError("Found an idivf of 0.")
+
+        torsion_parameters[pot_key] = (periodicity, phase, k / idivf)
+
+    for top_key, pot_key in proper_torsion_handler.key_map.items():
+        openff_indices = top_key.atom_indices
+        openmm_indices = tuple(particle_map[index] for index in openff_indices)
+
         torsion_force.addTorsion(
             openmm_indices[0],
             openmm_indices[1],
             openmm_indices[2],
             openmm_indices[3],
-            periodicity,
-            phase,
-            k / idivf,
+            *torsion_parameters[pot_key],
         )
 
 
@@ -247,30 +265,24 @@ def _process_rb_torsion_forces(interchange, openmm_sys, particle_map):
 
     rb_torsion_handler = interchange["RBTorsions"]
 
+    rb_parameters: dict[PotentialKey, tuple[float, ...]] = {
+        pot_key: tuple(
+            potential.parameters[f"c{i}"].m_as(off_unit.kilojoule / off_unit.mol)
+            for i in range(6)
+        )
+        for pot_key, potential in rb_torsion_handler.potentials.items()
+    }
+
     for top_key, pot_key in rb_torsion_handler.key_map.items():
         openff_indices = top_key.atom_indices
         openmm_indices = tuple(particle_map[index] for index in openff_indices)
 
-        params = rb_torsion_handler.potentials[pot_key].parameters
-
-        c0 = params["c0"].m_as(off_unit.kilojoule / off_unit.mol)
-        c1 = params["c1"].m_as(off_unit.kilojoule / off_unit.mol)
-        c2 = params["c2"].m_as(off_unit.kilojoule / off_unit.mol)
-        c3 = params["c3"].m_as(off_unit.kilojoule / off_unit.mol)
-        c4 = params["c4"].m_as(off_unit.kilojoule / off_unit.mol)
-        c5 = params["c5"].m_as(off_unit.kilojoule / off_unit.mol)
-
         rb_force.addTorsion(
             openmm_indices[0],
             openmm_indices[1],
             openmm_indices[2],
             openmm_indices[3],
-            c0,
-            c1,
-            c2,
-            c3,
-            c4,
-            c5,
+            *rb_parameters[pot_key],
         )
 
 
@@ -290,10 +302,9 @@ def _process_improper_torsion_forces(interchange, openmm_sys, particle_map):
 
     improper_torsion_handler = interchange["ImproperTorsions"]
 
-    for top_key, pot_key in improper_torsion_handler.key_map.items():
-        openff_indices = top_key.atom_indices
-        openmm_indices = tuple(particle_map[index] for index in openff_indices)
+    torsion_parameters: dict[PotentialKey, tuple[int, float, float]] = dict()
 
+    for pot_key in dict.fromkeys(improper_torsion_handler.key_map.values()):
         params = improper_torsion_handler.potentials[pot_key].parameters
 
         k = params["k"].m_as(off_unit.kilojoule / off_unit.mol)
@@ -301,14 +312,18 @@ def _process_improper_torsion_forces(interchange, openmm_sys, particle_map):
         phase = params["phase"].m_as(off_unit.radian)
         idivf = int(params["idivf"])
 
+        torsion_parameters[pot_key] = (periodicity, phase, k / idivf)
+
+    for top_key, pot_key in improper_torsion_handler.key_map.items():
+        openff_indices = top_key.atom_indices
+        openmm_indices = tuple(particle_map[index] for index in openff_indices)
+
         torsion_force.addTorsion(
             openmm_indices[0],
             openmm_indices[1],
             openmm_indices[2],
             openmm_indices[3],
-            periodicity,
-            phase,
-            k / idivf,
+            *torsion_parameters[pot_key],
         )
 
 
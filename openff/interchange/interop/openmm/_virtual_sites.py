@@ -1,10 +1,10 @@
 """
 Helper functions for exporting virutal sites to OpenMM.
 """
-from typing import Union
+import math
+from typing import Callable, Optional, Union
 
-import numpy
-from openff.units import Quantity, unit
+from openff.units import unit
 from openff.units.openmm import to_openmm
 from openff.utilities.utilities import has_package
 
@@ -14,7 +14,10 @@ from openff.interchange.components._particles import (
     _DivalentLonePairVirtualSite,
     _VirtualSite,
 )
-from openff.interchange.interop._virtual_sites import _get_separation_by_atom_indices
+from openff.interchange.interop._virtual_sites import (
+    _get_separations_by_atom_indices,
+    _lookup_separation,
+)
 from openff.interchange.models import VirtualSiteKey
 
 if has_package("openmm"):
@@ -25,7 +28,10 @@ def _create_openmm_virtual_site(
     interchange: Interchange,
     virtual_site: "_VirtualSite",
     openff_openmm_particle_map: dict[Union[int, VirtualSiteKey], int],
+    separations: Optional[dict[tuple[int, int], float]] = None,
 ) -> openmm.VirtualSite:
+    # `separations` can be passed, from `_get_separations_by_atom_indices`, when creating many
+    # virtual sites from the same Interchange to avoid repeatedly searching for bond lengths
     # virtual_site.orientations is a list of the _openff_ indices, which is more or less
     # the topology index in a topology containing only atoms (no virtual site). This dict,
     # _if only looking up atoms_, can be used to map between openff "indices" and
@@ -33,67 +39,76 @@ def _create_openmm_virtual_site(
     # and the openmm "index" is the atom's index, as a particle, in the openmm system. This
     # mapping has a different meaning if looking up a virtual site, but that should not happen here
     # as a virtual site's orientation atom should never be a virtual site
-    openmm_indices: list[int] = [
-        openff_openmm_particle_map[openff_index]
-        for openff_index in virtual_site.orientations
-    ]
-
-    if isinstance(virtual_site, _BondChargeVirtualSite):
-        separation = _get_separation_by_atom_indices(
-            interchange=interchange,
-            atom_indices=virtual_site.orientations,
-        )
-        distance = virtual_site.distance
+    openmm_indices: list[int] = list(
+        map(openff_openmm_particle_map.__getitem__, virtual_site.orientations),
+    )
+
+    try:
+        create_site = _VIRTUAL_SITE_CREATORS[type(virtual_site)]
+    except KeyError:
+        return _create_openmm_local_coordinates_site(virtual_site, openmm_indices)
 
-        ratio = (distance / separation).m_as(unit.dimensionless)
+    if separations is None:
+        separations = _get_separations_by_atom_indices(interchange)
 
-        return openmm.TwoParticleAverageSite(
+    return create_site(virtual_site, openmm_indices, separations)
+
+
+def _create_openmm_bond_charge_site(
+    virtual_site: "_BondChargeVirtualSite",
+    openmm_indices: list[int],
+    separations: dict[tuple[int, int], float],
+) -> openmm.VirtualSite:
+    separation = _lookup_separation(separations, virtual_site.orientations)
+
+    ratio = virtual_site.distance.m_as(unit.nanometer) / separation
+
+    return openmm.TwoParticleAverageSite(
+        *openmm_indices,
+        1.0 + ratio,
+        0.0 - ratio,
+    )
+
+
+def _create_openmm_divalent_lone_pair_site(
+    virtual_site: "_DivalentLonePairVirtualSite",
+    openmm_indices: list[int],
+    separations: dict[tuple[int, int], float],
+) -> openmm.VirtualSite:
+    r12 = _lookup_separation(separations, virtual_site.orientations[:2])
+    r13 = _lookup_separation(
+        separations,
+        (virtual_site.orientations[0], virtual_site.orientations[2]),
+    )
+
+    # TODO: Test r12 != r13, prima facia the math also applies, probably need
+    #       a more direct way to get r1mid
+    if r12 == r13 and float(virtual_site.out_of_plane_angle.m) == 0.0:
+        r23 = _lookup_separation(separations, virtual_site.orientations[1:])
+
+        cos_theta = (r23**2 - r12**2 - r13**2) / (-2 * r12 * r13)
+
+        # cos(theta / 2) from the half-angle identity, without computing theta itself;
+        # theta is in [0, pi], so the positive root is always the right one. Clamp so that
+        # round-off pushing cos(theta) just below -1 does not leave math.sqrt's domain
+        r1mid = math.sqrt(max(0.0, (1 + cos_theta) / 2)) * r12
+
+        w1 = 1 + virtual_site.distance.m_as(unit.nanometer) / r1mid
+
+        return openmm.ThreeParticleAverageSite(
             *openmm_indices,
-            1.0 + ratio,
-            0.0 - ratio,
+            w1,
+            (1 - w1) / 2,
+            (1 - w1) / 2,
         )
 
-    if isinstance(virtual_site, _DivalentLonePairVirtualSite):
-        r12 = _get_separation_by_atom_indices(
-            interchange=interchange,
-            atom_indices=virtual_site.orientations[:2],
-        )
-        r13 = _get_separation_by_atom_indices(
-            interchange=interchange,
-            atom_indices=(virtual_site.orientations[0], virtual_site.orientations[2]),
-        )
+    return _create_openmm_local_coordinates_site(virtual_site, openmm_indices)
 
-        distance = virtual_site.distance
-
-        # TODO: Test r12 != r13, prima facia the math also applies, probably need
-        #       a more direct way to get r1mid
-        if r12 == r13 and float(virtual_site.out_of_plane_angle.m) == 0.0:
-            r23 = _get_separation_by_atom_indices(
-                interchange=interchange,
-                atom_indices=virtual_site.orientations[1:],
-            )
-
-            theta = Quantity(
-                numpy.arccos(
-                    (r23**2 - r12**2 - r13**2) / (-2 * r12 * r13),
-                ),
-                unit.radian,
-            )
-
-            r1mid = Quantity(
-                numpy.cos(theta.m_as(unit.radian) / 2) * r12.m_as(unit.nanometer),
-                unit.nanometer,
-            )
-
-            w1 = 1 + distance / r1mid
-
-            return openmm.ThreeParticleAverageSite(
-                *openmm_indices,
-                w1,
-                (1 - w1) / 2,
-                (1 - w1) / 2,
-            )
 
+def _create_openmm_local_coordinates_site(
+    virtual_site: "_VirtualSite",
+    openmm_indices: list[int],
+) -> openmm.VirtualSite:
     # It is assumed that the first "orientation" atom is the "parent" atom.
     originwt, xdir, ydir = virtual_site.local_frame_weights
     pos = virtual_site.local_frame_positions
@@ -105,3 +120,10 @@ def _create_openmm_virtual_site(
         ydir,
         to_openmm(pos),
     )
+
+
+# Virtual site types without an entry here are exported as `openmm.LocalCoordinatesSite`s
+_VIRTUAL_SITE_CREATORS: dict[type["_VirtualSite"], Callable] = {
+    _BondChargeVirtualSite: _create_openmm_bond_charge_site,
+    _DivalentLonePairVirtualSite: _create_openmm_divalent_lone_pair_site,
+}
@@ -48,13 +48,15 @@ _PLUGIN_CLASS_MAPPING: dict[
     type["SMIRNOFFCollection"],
 ] = dict()
 
+_HANDLER_PLUGINS = load_handler_plugins()
+
 for collection_plugin in load_smirnoff_plugins():
     parameter_handlers: list[
         type["ParameterHandler"]
     ] = collection_plugin.allowed_parameter_handlers()
 
     for parameter_handler in parameter_handlers:
-        if parameter_handler in load_handler_plugins():
+        if parameter_handler in _HANDLER_PLUGINS:
             _SUPPORTED_PARAMETER_HANDLERS.add(parameter_handler._TAGNAME)
             _PLUGIN_CLASS_MAPPING[parameter_handler] = collection_plugin
         else:
@@ -67,15 +69,21 @@ for collection_plugin in load_smirnoff_plugins():
 
 
 def _check_supported_handlers(force_field: ForceField):
-    unsupported = list()
+    registered_handlers = force_field.registered_parameter_handlers
 
-    for handler_name in force_field.registered_parameter_handlers:
-        if handler_name in {"ToolkitAM1BCC"}:
-            continue
-        if handler_name not in _SUPPORTED_PARAMETER_HANDLERS:
-            unsupported.append(handler_name)
+    unsupported_handlers = set(registered_handlers).difference(
+        _SUPPORTED_PARAMETER_HANDLERS,
+        {"ToolkitAM1BCC"},
+    )
+
+    if unsupported_handlers:
+        # Report the unsupported handlers in the force field's order
+        unsupported = [
+            handler_name
+            for handler_name in registered_handlers
+            if handler_name in unsupported_handlers
+        ]
 
-    if unsupported:
         raise SMIRNOFFHandlersNotImplementedError(
             f"SMIRNOFF section(s) not implemented in Interchange: {unsupported}",
         )
@@ -353,6 +361,8 @@ def _plugins(
     force_field: ForceField,
     topology: Topology,
 ):
+    registered_handlers = set(force_field.registered_parameter_handlers)
+
     for collection_class in _PLUGIN_CLASS_MAPPING.values():
         # Track the handlers (keys) that map to this collection (value)
         handler_classes = [
@@ -361,11 +371,8 @@ def _plugins(
             if _PLUGIN_CLASS_MAPPING[handler] == collection_class
         ]
 
-        if not all(
-            [
-                handler_class._TAGNAME in force_field.registered_parameter_handlers
-                for handler_class in handler_classes
-            ],
+        if not registered_handlers.issuperset(
+            handler_class._TAGNAME for handler_class in handler_classes
         ):
             continue
 